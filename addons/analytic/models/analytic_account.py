@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 
 
 class AccountAnalyticTag(models.Model):
@@ -27,22 +27,27 @@ class AccountAnalyticAccount(models.Model):
         if self._context.get('to_date', False):
             domain.append(('date', '<=', self._context['to_date']))
 
-        credit_groups = analytic_line_obj.read_group(
-            domain=domain + [('amount', '>=', 0.0)],
-            fields=['account_id', 'amount'],
-            groupby=['account_id']
-        )
-        data_credit = {l['account_id'][0]: l['amount'] for l in credit_groups}
-        debit_groups = analytic_line_obj.read_group(
-            domain=domain + [('amount', '<', 0.0)],
-            fields=['account_id', 'amount'],
-            groupby=['account_id']
-        )
-        data_debit = {l['account_id'][0]: l['amount'] for l in debit_groups}
+        # sum credit and debit in a single pass over the lines, instead of
+        # one read_group per sign
+        analytic_line_obj.check_access_rights('read')
+        query = analytic_line_obj._where_calc(domain)
+        analytic_line_obj._apply_ir_rules(query, 'read')
+        from_clause, where_clause, where_clause_params = query.get_sql()
+        where_str = where_clause and (" WHERE %s" % where_clause) or ''
+        query_str = """
+            SELECT "account_analytic_line".account_id,
+                   SUM(CASE WHEN "account_analytic_line".amount >= 0 THEN "account_analytic_line".amount ELSE 0 END),
+                   SUM(CASE WHEN "account_analytic_line".amount < 0 THEN "account_analytic_line".amount ELSE 0 END)
+            FROM """ + from_clause + where_str + """
+            GROUP BY "account_analytic_line".account_id
+        """
+        self._cr.execute(query_str, where_clause_params)
+        data = {account_id: (credit, debit) for account_id, credit, debit in self._cr.fetchall()}
 
         for account in self:
-            account.debit = abs(data_debit.get(account.id, 0.0))
-            account.credit = data_credit.get(account.id, 0.0)
+            credit, debit = data.get(account.id, (0.0, 0.0))
+            account.debit = abs(debit)
+            account.credit = credit
             account.balance = account.credit - account.debit
 
     name = fields.Char(string='Analytic Account', index=True, required=True, track_visibility='onchange')
@@ -65,13 +70,18 @@ class AccountAnalyticAccount(models.Model):
 
     @api.multi
     def name_get(self):
+        # resolve commercial partner names once, on a recordset that only
+        # fetches the partner fields used here; walking analytic.partner_id
+        # in the loop would prefetch every stored field of res.partner
+        partners = self.mapped('partner_id').with_context(prefetch_fields=False)
+        commercial_names = {partner.id: partner.commercial_partner_id.name for partner in partners}
         res = []
         for analytic in self:
             name = analytic.name
             if analytic.code:
                 name = '['+analytic.code+'] '+name
             if analytic.partner_id:
-                name = name +' - '+analytic.partner_id.commercial_partner_id.name
+                name = name +' - '+(commercial_names.get(analytic.partner_id.id) or '')
             res.append((analytic.id, name))
         return res
 
@@ -80,10 +90,13 @@ class AccountAnalyticAccount(models.Model):
         if operator not in ('ilike', 'like', '=', '=like', '=ilike'):
             return super(AccountAnalyticAccount, self).name_search(name, args, operator, limit)
         args = args or []
-        domain = ['|', ('code', operator, name), ('name', operator, name)]
-        partners = self.env['res.partner'].search([('name', operator, name)], limit=limit)
-        if partners:
-            domain = ['|'] + domain + [('partner_id', 'in', partners.ids)]
+        domain = []
+        # optimize out the default criterion of ``ilike ''`` that matches everything
+        if not (name == '' and operator == 'ilike'):
+            domain = ['|', ('code', operator, name), ('name', operator, name)]
+            partner_ids = self.env['res.partner']._search([('name', operator, name)], limit=limit)
+            if partner_ids:
+                domain = ['|'] + domain + [('partner_id', 'in', partner_ids)]
         recs = self.search(domain + args, limit=limit)
         return recs.name_get()
 
@@ -101,7 +114,8 @@ class AccountAnalyticLine(models.Model):
     date = fields.Date('Date', required=True, index=True, default=fields.Date.context_today)
     amount = fields.Monetary('Amount', required=True, default=0.0)
     unit_amount = fields.Float('Quantity', default=0.0)
-    account_id = fields.Many2one('account.analytic.account', 'Analytic Account', required=True, ondelete='restrict', index=True)
+    # indexed by the composite (account_id, date) index created in _auto_init
+    account_id = fields.Many2one('account.analytic.account', 'Analytic Account', required=True, ondelete='restrict')
     partner_id = fields.Many2one('res.partner', string='Partner')
     user_id = fields.Many2one('res.users', string='User', default=_default_user)
 
@@ -109,3 +123,10 @@ class AccountAnalyticLine(models.Model):
 
     company_id = fields.Many2one(related='account_id.company_id', string='Company', store=True, readonly=True)
     currency_id = fields.Many2one(related="company_id.currency_id", string="Currency", readonly=True)
+
+    @api.model_cr_context
+    def _auto_init(self):
+        res = super(AccountAnalyticLine, self)._auto_init()
+        tools.create_index(self._cr, 'account_analytic_line_account_id_date_idx',
+                           self._table, ['account_id', 'date'])
+        return res
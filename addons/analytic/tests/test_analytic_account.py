@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo.tests.common import TransactionCase
+
+
+class TestAnalyticAccount(TransactionCase):
+
+    def setUp(self):
+        super(TestAnalyticAccount, self).setUp()
+        self.company_partner = self.env['res.partner'].create({
+            'name': 'Customer Company',
+            'is_company': True,
+        })
+        self.contact = self.env['res.partner'].create({
+            'name': 'Customer Contact',
+            'parent_id': self.company_partner.id,
+        })
+        self.analytic_account = self.env['account.analytic.account'].create({
+            'name': 'Project X',
+            'code': 'PX',
+            'partner_id': self.contact.id,
+        })
+
+    def test_name_get(self):
+        self.assertEqual(self.analytic_account.name_get(), [
+            (self.analytic_account.id, '[PX] Project X - Customer Company'),
+        ])
+
+    def test_name_get_new_record(self):
+        analytic_account = self.env['account.analytic.account'].new({
+            'name': 'Project Y',
+            'code': 'PY',
+            'partner_id': self.contact.id,
+        })
+        self.assertEqual(analytic_account.name_get(), [
+            (analytic_account.id, '[PY] Project Y - Customer Company'),
+        ])
+        self.assertEqual(analytic_account.display_name, '[PY] Project Y - Customer Company')
+
+    def test_name_get_shared_commercial_partner(self):
+        other_account = self.env['account.analytic.account'].create({
+            'name': 'Project Z',
+            'partner_id': self.company_partner.id,
+        })
+        accounts = self.analytic_account | other_account
+        self.assertEqual(accounts.name_get(), [
+            (self.analytic_account.id, '[PX] Project X - Customer Company'),
+            (other_account.id, 'Project Z - Customer Company'),
+        ])
+
+    def test_name_search(self):
+        AnalyticAccount = self.env['account.analytic.account']
+        internal_account = AnalyticAccount.create({
+            'name': 'Internal',
+            'code': 'CUST-INT',
+        })
+        accounts = self.analytic_account | internal_account
+        args = [('id', 'in', accounts.ids)]
+
+        # empty search matches accounts with and without a partner
+        result = AnalyticAccount.name_search('', args)
+        self.assertEqual(set(res[0] for res in result), set(accounts.ids))
+
+        # search on the partner name
+        result = AnalyticAccount.name_search('Customer Contact', args)
+        self.assertEqual([res[0] for res in result], self.analytic_account.ids)
+
+        # a term matching partners still finds, by code, an account without partner
+        result = AnalyticAccount.name_search('Cust', args)
+        self.assertEqual(set(res[0] for res in result), set(accounts.ids))
+
+    def test_debit_credit_balance(self):
+        AnalyticLine = self.env['account.analytic.line']
+        for date, amount in [('2017-01-10', 100.0), ('2017-01-15', -30.0),
+                             ('2017-02-10', 50.0), ('2017-02-15', -20.0)]:
+            AnalyticLine.create({
+                'name': 'Line %s' % amount,
+                'account_id': self.analytic_account.id,
+                'date': date,
+                'amount': amount,
+            })
+        empty_account = self.env['account.analytic.account'].create({'name': 'Empty'})
+
+        account = self.analytic_account
+        self.assertEqual((account.debit, account.credit, account.balance), (50.0, 150.0, 100.0))
+        self.assertEqual((empty_account.debit, empty_account.credit, empty_account.balance), (0.0, 0.0, 0.0))
+
+        account = self.analytic_account.with_context(from_date='2017-02-01')
+        self.assertEqual((account.debit, account.credit, account.balance), (20.0, 50.0, 30.0))
+
+        account = self.analytic_account.with_context(to_date='2017-01-31')
+        self.assertEqual((account.debit, account.credit, account.balance), (30.0, 100.0, 70.0))
+
+        account = self.analytic_account.with_context(from_date='2017-01-12', to_date='2017-02-12')
+        self.assertEqual((account.debit, account.credit, account.balance), (30.0, 50.0, 20.0))